@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache for parsed SonarCloud/SwiftLint aggregates.
+
+CI invokes several scripts against the same JSON dump; caching the
+parsed aggregates in a pickle keyed by the SHA-256 of the file lets
+repeat invocations skip parsing entirely. Invalidation is automatic:
+a changed file hashes to a different cache path.
+"""
+
+import hashlib
+import mmap
+import pickle
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+
+def _digest(path):
+    """SHA-256 of the file contents, hashed zero-copy via mmap."""
+    with open(path, 'rb') as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.sha256(mm).hexdigest()
+        except ValueError:
+            # Empty files cannot be mmapped
+            return hashlib.sha256(f.read()).hexdigest()
+
+
+def load_json(path):
+    """Parse a whole JSON file, memory-mapping it to skip the read() copy.
+
+    orjson parses straight out of the page cache via a memoryview; the
+    stdlib fallback needs a bytes object, so it copies once.
+    """
+    with open(path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return _json.loads(f.read())
+        with mm:
+            if _json.__name__ == 'orjson':
+                return _json.loads(memoryview(mm))
+            return _json.loads(mm[:])
+
+
+def load(path, kind):
+    """Return (digest, cached value or None) for the JSON at path.
+
+    kind namespaces the cache so consumers that derive different
+    aggregates from the same file do not collide.
+    """
+    digest = _digest(path)
+    try:
+        with open(f'{path}.{kind}.{digest}.pkl', 'rb') as f:
+            return digest, pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return digest, None
+
+
+def store(path, kind, digest, value):
+    """Pickle value next to the JSON, keyed by its content digest."""
+    with open(f'{path}.{kind}.{digest}.pkl', 'wb') as f:
+        pickle.dump(value, f, protocol=5)
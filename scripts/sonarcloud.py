@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+SonarCloud report tooling: format, process and summarize issue dumps.
+
+Subcommands:
+    format   - print SwiftLint JSON output as a SonarCloud-like report
+    process  - write a readable findings report from sonarcloud-issues.json
+    summary  - print issue counts by type and severity
+    report   - process plus summary from a single pass over the issues
+
+The original standalone scripts (format_swiftlint_sonar.py,
+process_sonarcloud_issues.py, sonarcloud_summary.py) remain as thin
+shims onto these subcommands, so one parse can feed every consumer.
+"""
+
+import argparse
+import itertools
+import sys
+from collections import Counter, defaultdict
+from datetime import datetime
+from operator import itemgetter
+
+import sonar_cache
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Severity order used for report sections and summary output
+_SEVERITY_ORDER = ['BLOCKER', 'CRITICAL', 'MAJOR', 'MINOR', 'INFO']
+
+# Only the first _LIMIT SwiftLint issues are printed
+_LIMIT = 50
+
+# Pulls all report fields from an issue in one C call; merged over
+# _ISSUE_DEFAULTS so absent keys cannot raise
+_ISSUE_FIELDS = itemgetter(
+    'type', 'component', 'rule', 'message', 'effort', 'status', 'textRange')
+_ISSUE_DEFAULTS = {
+    'type': 'UNKNOWN',
+    'component': 'unknown',
+    'rule': 'unknown',
+    'message': 'No message',
+    'effort': None,
+    'status': 'OPEN',
+    'textRange': None,
+}
+
+
+def iter_issues(path):
+    """Yield issues one at a time, streaming with ijson when available."""
+    if ijson is not None:
+        with open(path, 'rb') as f:
+            yield from ijson.items(f, 'issues.item', use_float=True)
+    else:
+        yield from sonar_cache.load_json(path).get('issues', [])
+
+
+def collect_by_severity(issues_path, wanted=None):
+    """Bucket issues by severity in one streaming pass, via the cache."""
+    cache_kind = ('severity' if wanted is None
+                  else 'severity.' + '-'.join(sorted(wanted)))
+    digest, cached = sonar_cache.load(issues_path, cache_kind)
+    if cached is not None:
+        return cached
+    by_severity = defaultdict(list)
+    total = 0
+    for issue in iter_issues(issues_path):
+        severity = issue.get('severity', 'UNKNOWN')
+        if wanted is not None and severity not in wanted:
+            continue
+        by_severity[severity].append(issue)
+        total += 1
+    sonar_cache.store(issues_path, cache_kind, digest,
+                      (dict(by_severity), total))
+    return by_severity, total
+
+
+def write_findings_report(report_path, project_key, by_severity, total):
+    """Write the readable findings report from severity buckets."""
+    # A large buffer plus one joined write per issue keeps the
+    # emission loop out of small write calls
+    with open(f'{report_path}/sonarcloud-findings.txt', 'w',
+              buffering=1 << 20) as report:
+        report.write(
+            f'=== SonarCloud Findings Report ===\n'
+            f'Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}\n'
+            f'Project: {project_key}\n'
+            f'Total issues: {total}\n\n')
+
+        for severity in _SEVERITY_ORDER:
+            if severity not in by_severity:
+                continue
+
+            report.write(
+                f'\n{"=" * 50}\n'
+                f'{severity} ISSUES ({len(by_severity[severity])})\n'
+                f'{"=" * 50}\n\n')
+
+            for issue in by_severity[severity]:
+                issue_type, component, rule, message, effort, status, \
+                    text_range = _ISSUE_FIELDS({**_ISSUE_DEFAULTS, **issue})
+                component = component.replace(f'{project_key}:', '')
+                line = (text_range or {}).get('startLine', 0)
+
+                lines = [
+                    f'[{issue_type}] {component}:{line}\n',
+                    f'  Rule: {rule}\n',
+                    f'  Message: {message}\n',
+                ]
+
+                # Add effort if available
+                if effort:
+                    lines.append(f'  Effort: {effort}\n')
+
+                # Add status
+                if status != 'OPEN':
+                    lines.append(f'  Status: {status}\n')
+
+                lines.append('\n')
+                report.write(''.join(lines))
+
+
+def count_issues(path):
+    """Count issues by type and severity without materializing them.
+
+    With ijson only the key/value events for each issue are visited, so
+    rule, message and textRange strings are never built; the fallback
+    parses the whole document with orjson/stdlib json.
+    """
+    types = Counter()
+    severities = Counter()
+    if ijson is not None:
+        with open(path, 'rb') as f:
+            for key, value in ijson.kvitems(f, 'issues.item'):
+                if key == 'type':
+                    types[value] += 1
+                elif key == 'severity':
+                    severities[value] += 1
+    else:
+        for issue in sonar_cache.load_json(path).get('issues', []):
+            types[issue.get('type', 'UNKNOWN')] += 1
+            severities[issue.get('severity', 'UNKNOWN')] += 1
+    return types, severities
+
+
+def print_summary(types, severities):
+    """Print the by-type and by-severity counts."""
+    # Alphabetical order is part of the output contract; itemgetter
+    # keeps the sort key in C and avoids tuple-wise comparisons that
+    # would also compare the counts
+    print('By Type:')
+    for t, count in sorted(types.items(), key=itemgetter(0)):
+        print(f'  - {t}: {count}')
+
+    print('\nBy Severity:')
+    for s in _SEVERITY_ORDER:
+        if s in severities:
+            print(f'  - {s}: {severities[s]}')
+
+
+def head_and_count(path):
+    """Return the first _LIMIT SwiftLint issues and the total count.
+
+    With ijson only the printed issues are ever built as dicts; the
+    rest of the file is counted from parse events. The fallback parses
+    the whole document.
+    """
+    if ijson is None:
+        issues = sonar_cache.load_json(path)
+        return issues[:_LIMIT], len(issues)
+    with open(path, 'rb') as f:
+        head = list(itertools.islice(ijson.items(f, 'item'), _LIMIT))
+    if len(head) < _LIMIT:
+        return head, len(head)
+    # Count the top-level array items without materializing them
+    with open(path, 'rb') as f:
+        total = sum(1 for prefix, event, _ in ijson.parse(f)
+                    if prefix == 'item' and event == 'start_map')
+    return head, total
+
+
+def cmd_format(args):
+    """Format SwiftLint JSON output as a SonarCloud-like report."""
+    try:
+        lint_path = args.lint_path
+        digest, cached = sonar_cache.load(lint_path, 'head')
+        if cached is None:
+            cached = head_and_count(lint_path)
+            sonar_cache.store(lint_path, 'head', digest, cached)
+        issues, total = cached
+
+        if not issues:
+            print('No issues found')
+            return 0
+
+        for issue in issues:
+            severity = issue.get('severity', 'Warning')
+            rule_id = issue.get('rule_id', 'unknown')
+
+            # Categorize issue
+            if severity == 'Error':
+                category = 'BUG'
+                level = 'BLOCKER'
+            elif 'security' in rule_id.lower() or 'auth' in rule_id.lower():
+                category = 'SECURITY_HOTSPOT'
+                level = 'CRITICAL'
+            else:
+                category = 'CODE_SMELL'
+                level = 'MINOR'
+
+            # Format output
+            file_path = issue.get('file', 'unknown')
+            line = issue.get('line', 0)
+            reason = issue.get('reason', 'No description')
+
+            print(f'[{category}] {level}: {file_path}:{line}')
+            print(f'  Message: {reason}')
+            print(f'  Rule: {rule_id}')
+            print()
+
+        if total > _LIMIT:
+            print(f'\n... and {total - _LIMIT} more issues')
+        return 0
+
+    except Exception as e:
+        print(f'Error processing SwiftLint output: {e}')
+        return 0
+
+
+def cmd_process(args):
+    """Generate the readable findings report."""
+    try:
+        by_severity, total = collect_by_severity(
+            f'{args.report_path}/sonarcloud-issues.json', args.wanted)
+        write_findings_report(
+            args.report_path, args.project_key, by_severity, total)
+        print(f'✅ Successfully processed {total} issues')
+        return 0
+    except Exception as e:
+        print(f'Error processing SonarCloud response: {e}')
+        return 1
+
+
+def cmd_summary(args):
+    """Print issue counts by type and severity."""
+    issues_path = f'{args.report_path}/sonarcloud-issues.json'
+    digest, cached = sonar_cache.load(issues_path, 'summary')
+    if cached is not None:
+        types, severities = cached
+    else:
+        types, severities = count_issues(issues_path)
+        sonar_cache.store(issues_path, 'summary', digest, (types, severities))
+    print_summary(types, severities)
+    return 0
+
+
+def cmd_report(args):
+    """Findings report plus summary from one pass over the issues."""
+    try:
+        by_severity, total = collect_by_severity(
+            f'{args.report_path}/sonarcloud-issues.json', args.wanted)
+        write_findings_report(
+            args.report_path, args.project_key, by_severity, total)
+        print(f'✅ Successfully processed {total} issues')
+    except Exception as e:
+        print(f'Error processing SonarCloud response: {e}')
+        return 1
+
+    # Derive the summary from the in-memory buckets instead of
+    # reparsing the JSON
+    types = Counter()
+    severities = Counter()
+    for severity, issues in by_severity.items():
+        severities[severity] = len(issues)
+        for issue in issues:
+            types[issue.get('type', 'UNKNOWN')] += 1
+
+    print('\n📊 Summary:')
+    print_summary(types, severities)
+    return 0
+
+
+def _add_issue_args(parser):
+    parser.add_argument('report_path', nargs='?', default='.sonarcloud')
+    parser.add_argument('project_key', nargs='?',
+                        default='lekman_magsafe-buskill')
+    parser.add_argument(
+        '--severities',
+        help='Comma-separated severities to report, e.g. '
+             'BLOCKER,CRITICAL,MAJOR. The producer should pass the same '
+             'list as the severities= query param when fetching issues so '
+             'the server filters instead of this script.')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    format_parser = subparsers.add_parser(
+        'format', help='format SwiftLint JSON output')
+    format_parser.add_argument(
+        'lint_path', nargs='?', default='.sonarcloud/swiftlint-output.json')
+    format_parser.set_defaults(func=cmd_format)
+
+    process_parser = subparsers.add_parser(
+        'process', help='write the readable findings report')
+    _add_issue_args(process_parser)
+    process_parser.set_defaults(func=cmd_process)
+
+    summary_parser = subparsers.add_parser(
+        'summary', help='print issue counts by type and severity')
+    summary_parser.add_argument('report_path', nargs='?',
+                                default='.sonarcloud')
+    summary_parser.set_defaults(func=cmd_summary)
+
+    report_parser = subparsers.add_parser(
+        'report', help='findings report plus summary in one pass')
+    _add_issue_args(report_parser)
+    report_parser.set_defaults(func=cmd_report)
+
+    args = parser.parse_args(argv)
+    if hasattr(args, 'severities'):
+        args.wanted = (set(args.severities.upper().split(','))
+                       if args.severities else None)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Convert `swift test` output to JUnit XML for Codecov Test Analytics.
+
+Reads XCTest log lines from stdin and writes JUnit XML to stdout:
+    swift test 2>&1 | python3 scripts/swift-test-to-junit.py > test-results.xml
+"""
+
+import io
+import re
+import sys
+from typing import NamedTuple, Optional
+from xml.sax.saxutils import quoteattr
+
+
+class _Test(NamedTuple):
+    """A finished test case; tuple storage avoids a dict per test."""
+    classname: str
+    name: str
+    time: float
+    status: str
+    message: Optional[str]
+    error_type: Optional[str]
+
+# Single alternation compiled once at module scope; the branch that
+# fired is identified by match.lastgroup, so each line pays for one
+# regex engine run instead of a cascade of up to six failed matches
+_LINE_RE = re.compile(
+    r"(?m)^(?P<suite>Test Suite '(?P<sname>.+)' started)"
+    r"|^(?P<start>Test Case '-\[(?P<cls>.+) (?P<nm>.+)\]' started)"
+    r"|^(?P<passed>Test Case .+ passed \((?P<pt>[\d.]+) seconds\))"
+    r"|^(?P<failed>Test Case .+ failed \((?P<ft>[\d.]+) seconds\))"
+    r"|^(?P<skip>Test .+ skipped)"
+    r"|^(?P<err>(?P<ef>.+?):(?P<el>\d+): error: (?P<ek>.+?) : (?P<em>.+?))\r?$"
+)
+
+# Read stdin in large chunks rather than line-by-line
+_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+class SwiftTestParser:
+    """Parses XCTest console output into structured test results."""
+
+    def __init__(self):
+        self.test_results = []
+        self.current_suite = None
+        self.current_test = None
+        self._total_time = 0.0
+
+    def _finish(self, status, time=0.0):
+        """Freeze the in-flight test into a _Test row."""
+        test = self.current_test
+        self.test_results.append(_Test(
+            test['classname'], test['name'], time, status,
+            test['message'], test['error_type']))
+        self._total_time += time
+        self.current_test = None
+
+    def parse_line(self, line):
+        """Parse a single line of swift test output."""
+        # Fast path: most lines are build/stdout noise that no pattern
+        # can match, so skip them without touching the regex engine
+        if not line.startswith('Test') and ': error: ' not in line:
+            return
+
+        match = _LINE_RE.match(line)
+        if match:
+            self.handle_match(match)
+
+    def handle_match(self, match):
+        """Update parser state from a _LINE_RE match."""
+        kind = match.lastgroup
+
+        if kind == 'suite':
+            self.current_suite = match.group('sname')
+        elif kind == 'start':
+            self.current_test = {
+                'classname': match.group('cls'),
+                'name': match.group('nm'),
+                'message': None,
+                'error_type': None,
+            }
+        elif kind == 'passed':
+            if self.current_test:
+                self._finish('passed', float(match.group('pt')))
+        elif kind == 'failed':
+            if self.current_test:
+                self._finish('failed', float(match.group('ft')))
+        elif kind == 'skip':
+            if self.current_test:
+                self._finish('skipped')
+        elif kind == 'err':
+            if self.current_test:
+                self.current_test['error_type'] = 'Failure'
+                self.current_test['message'] = (
+                    f"{match.group('ef')}:{match.group('el')}: "
+                    f"{match.group('em')}"
+                )
+
+    def write_junit_xml(self, out):
+        """Stream JUnit XML to a file object without building a tree."""
+        # Group tests by class name and accumulate every total in the
+        # same pass instead of re-scanning the results per attribute
+        suites = {}
+        fail_counts = {}
+        suite_times = {}
+        total_failures = 0
+        for test in self.test_results:
+            cls = test.classname
+            if cls in suites:
+                suites[cls].append(test)
+                suite_times[cls] += test.time
+            else:
+                suites[cls] = [test]
+                suite_times[cls] = test.time
+                fail_counts[cls] = 0
+            if test.status == 'failed':
+                total_failures += 1
+                fail_counts[cls] += 1
+
+        write = out.write
+        write("<?xml version='1.0' encoding='utf-8'?>\n")
+        root_attrs = (f'tests="{len(self.test_results)}" '
+                      f'failures="{total_failures}" '
+                      f'time="{self._total_time:.3f}"')
+        if not suites:
+            write(f'<testsuites {root_attrs} />\n')
+            return
+        write(f'<testsuites {root_attrs}>\n')
+
+        for suite_name, tests in suites.items():
+            write(f'  <testsuite name={quoteattr(suite_name)} '
+                  f'tests="{len(tests)}" '
+                  f'failures="{fail_counts[suite_name]}" '
+                  f'time="{suite_times[suite_name]:.3f}">\n')
+
+            for test in tests:
+                attrs = (f'classname={quoteattr(test.classname)} '
+                         f'name={quoteattr(test.name)} '
+                         f'time="{test.time:.3f}"')
+                if test.status == 'failed':
+                    failure_attrs = f'type={quoteattr(test.error_type or "Failure")}'
+                    if test.message:
+                        failure_attrs += f' message={quoteattr(test.message)}'
+                    write(f'    <testcase {attrs}>\n'
+                          f'      <failure {failure_attrs} />\n'
+                          f'    </testcase>\n')
+                elif test.status == 'skipped':
+                    write(f'    <testcase {attrs}>\n'
+                          f'      <skipped />\n'
+                          f'    </testcase>\n')
+                else:
+                    write(f'    <testcase {attrs} />\n')
+
+            write('  </testsuite>\n')
+        write('</testsuites>\n')
+
+    def generate_junit_xml(self):
+        """Serialize collected results as a pretty-printed JUnit XML string."""
+        buf = io.StringIO()
+        self.write_junit_xml(buf)
+        return buf.getvalue()
+
+
+def main():
+    test_parser = SwiftTestParser()
+    handle_match = test_parser.handle_match
+
+    # Slurp stdin in large chunks and let finditer walk each buffer in
+    # C, instead of dispatching Python-level regex calls per line. A
+    # trailing partial line is carried over into the next chunk.
+    carry = ''
+    while True:
+        chunk = sys.stdin.read(_CHUNK_SIZE)
+        if not chunk:
+            break
+        buf = carry + chunk
+        cut = buf.rfind('\n') + 1
+        carry = buf[cut:]
+        for match in _LINE_RE.finditer(buf, 0, cut):
+            handle_match(match)
+    if carry:
+        match = _LINE_RE.match(carry)
+        if match:
+            handle_match(match)
+
+    test_parser.write_junit_xml(sys.stdout)
+
+
+if __name__ == '__main__':
+    main()